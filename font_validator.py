@@ -2,6 +2,10 @@ from fontTools.ttLib import TTFont
 import numpy as np
 import math
 from collections import defaultdict
+from functools import lru_cache
+import hashlib
+import io
+import mmap
 import os
 
 def determine_font_style(font):
@@ -1612,23 +1616,69 @@ def detect_font_format(font, font_path):
     # If we can't determine, return a generic response
     return 'Unknown'
 
-def extract_font_properties(font_path):
+@lru_cache(maxsize=64)
+def _load_ttfont_cached(digest, data):
+    """
+    Parses raw font bytes into a TTFont, memoized by content digest.
+
+    The digest keys the entry together with the bytes, so repeated uploads of
+    the same font (comparison flows, retries) skip the fontTools parse. The
+    cache holds the bytes alive with each entry, bounding memory at maxsize
+    fonts. Tables are eagerly decompiled before the font is cached: TTFont
+    decompiles lazily through a shared reader on first access, and the cached
+    object is handed to every thread that asks for the same digest, so it has
+    to be fully materialized (read-only) before it escapes this function.
+
+    Args:
+        digest (str): blake2b hex digest of data.
+        data (bytes): The raw font file contents.
+
+    Returns:
+        TTFont: The parsed font object, fully decompiled.
+    """
+    font = TTFont(io.BytesIO(data))
+    font.ensureDecompiled()
+    return font
+
+def clear_ttfont_cache():
+    """Drops all memoized TTFont objects (manual eviction hook)."""
+    _load_ttfont_cached.cache_clear()
+
+def extract_font_properties(font_source, filename=None):
     """
     Loads a font file and extracts its style, weight, width, shape, and spacing.
     Supports TrueType (.ttf), OpenType (.otf), WOFF, and WOFF2 formats.
-    
+
     Args:
-        font_path (str): Path to the font file.
-    
+        font_source (str, bytes, or file-like): Path to the font file, or the
+            raw font data already read into memory (avoids a disk round-trip
+            when the caller just received the bytes, e.g. from an upload).
+        filename (str, optional): Original filename, used for format detection
+            when font_source is not a path.
+
     Returns:
         dict: Font properties including style, weight, width, shape, and spacing.
     """
     try:
-        # Load the font file
-        font = TTFont(font_path)
-        
+        # Load the font file (TTFont accepts a path or a file-like object)
+        if isinstance(font_source, (bytes, bytearray)):
+            data = bytes(font_source)
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            font = _load_ttfont_cached(digest, data)
+        elif hasattr(font_source, 'read'):
+            font = TTFont(font_source)
+        else:
+            # Memory-map path input so fontTools reads from the page cache
+            # instead of copying the whole file into the heap first; the
+            # mapping stays alive for as long as the font holds it
+            with open(font_source, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            font = TTFont(mapped)
+            if filename is None:
+                filename = font_source
+
         # Detect font format
-        font_format = detect_font_format(font, font_path)
+        font_format = detect_font_format(font, filename or '')
         
         # Extract weight from OS/2 table (e.g., 400 = normal, 700 = bold)
         # OS/2 table contains usWeightClass which is a numeric value representing weight
@@ -2032,83 +2082,123 @@ if __name__ == "__main__":
         print(f"Shape: {pacifico_info['shape']['type']}")
         print(f"Spacing: {pacifico_info['spacing']['width_type']} width, {pacifico_info['spacing']['spacing_type']} spacing")
 
-def visualize_font_properties(font_info, output_dir=None):
+_VIZ_PLOT_TYPES = ('personality_radar', 'metrics_chart', 'text_sample', 'use_cases')
+
+# Shared process pool for visualization rendering. Created on first use so
+# importing this module (e.g. from the CLI) doesn't spawn workers, then kept
+# alive to amortize the fork/import cost across requests.
+_VIZ_POOL = None
+
+def _get_viz_pool():
+    """Returns the lazily created process pool for visualization rendering."""
+    global _VIZ_POOL
+    if _VIZ_POOL is None:
+        from concurrent.futures import ProcessPoolExecutor
+        _VIZ_POOL = ProcessPoolExecutor(max_workers=max(2, (os.cpu_count() or 2) - 1))
+    return _VIZ_POOL
+
+def _figure_to_png(fig, **savefig_kwargs):
+    """Renders a matplotlib figure to PNG bytes without touching disk."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', **savefig_kwargs)
+    return buf.getvalue()
+
+def _write_png(item):
+    """Writes one rendered (path, bytes) pair to disk."""
+    path, data = item
+    with open(path, 'wb') as f:
+        f.write(data)
+
+def _render_one(plot_type, font_info, output_dir):
     """
-    Create visualizations of font properties and analysis results.
-    
+    Renders a single visualization type for a font.
+
+    Each call builds its own figure independently, so calls are safe to run
+    in parallel worker processes. Rendering goes to memory; the caller writes
+    all PNGs in one batched pass.
+
     Args:
+        plot_type (str): One of _VIZ_PLOT_TYPES.
         font_info (dict): Dictionary containing font analysis results
-        output_dir (str, optional): Directory to save visualizations. If None, displays them instead.
-        
+        output_dir (str, optional): Directory the visualization is destined
+            for. If None, displays it instead.
+
     Returns:
-        dict: Paths to generated visualization files if output_dir is provided, otherwise None
+        tuple: (path, png_bytes) if output_dir is provided and the font has
+            the data for this plot, otherwise None.
     """
     # Set the backend to 'Agg' which is non-interactive and doesn't require a GUI
     import matplotlib
     matplotlib.use('Agg')
-    
+
     import matplotlib.pyplot as plt
     import seaborn as sns
-    import numpy as np
-    import os
-    from PIL import Image, ImageDraw, ImageFont
-    from matplotlib.patches import Patch
-    from io import BytesIO
-    
+
     # Set style
     sns.set_style("whitegrid")
     plt.rcParams['font.family'] = 'sans-serif'
-    
-    # Create output directory if needed
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    
-    # Dictionary to store paths to visualization files
-    visualization_paths = {}
-    
-    # 1. Create personality radar chart
-    if 'personality' in font_info and 'dominant_traits' in font_info['personality']:
-        fig, ax = plt.subplots(figsize=(10, 8), subplot_kw=dict(polar=True))
-        
-        # Extract traits and values
-        traits = [t[0].capitalize() for t in font_info['personality']['dominant_traits']]
-        values = [t[1] for t in font_info['personality']['dominant_traits']]
-        
-        # Number of variables
-        N = len(traits)
-        
-        # Compute angle for each axis
-        angles = [n / float(N) * 2 * np.pi for n in range(N)]
-        angles += angles[:1]  # Close the loop
-        
-        # Add values (and close the loop)
-        values += values[:1]
-        
-        # Draw the plot
-        ax.plot(angles, values, linewidth=2, linestyle='solid')
-        ax.fill(angles, values, alpha=0.25)
-        
-        # Set labels and title
-        ax.set_xticks(angles[:-1])
-        ax.set_xticklabels(traits)
-        ax.set_title(f"Font Personality Profile: {font_info['font_name']}", size=15, pad=20)
-        
-        # Adjust radial limits
-        ax.set_ylim(0, 10)
-        
-        # Save or display
-        if output_dir:
-            radar_path = os.path.join(output_dir, f"{font_info['font_name'].replace(' ', '_')}_personality_radar.png")
-            plt.savefig(radar_path, dpi=300, bbox_inches='tight')
-            visualization_paths['personality_radar'] = radar_path
-            plt.close(fig)
-        else:
-            plt.tight_layout()
-            plt.show()
-    
-    # 2. Create weight and width comparison chart
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
+
+    if plot_type == 'personality_radar':
+        return _render_personality_radar(font_info, output_dir)
+    elif plot_type == 'metrics_chart':
+        return _render_metrics_chart(font_info, output_dir)
+    elif plot_type == 'text_sample':
+        return _render_text_sample(font_info, output_dir)
+    elif plot_type == 'use_cases':
+        return _render_use_cases(font_info, output_dir)
+    return None
+
+def _render_personality_radar(font_info, output_dir):
+    """Renders the personality radar chart. Returns (path, png_bytes) or None."""
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    if 'personality' not in font_info or 'dominant_traits' not in font_info['personality']:
+        return None
+
+    fig, ax = plt.subplots(figsize=(10, 8), subplot_kw=dict(polar=True))
+
+    # Extract traits and values
+    traits = [t[0].capitalize() for t in font_info['personality']['dominant_traits']]
+    values = [t[1] for t in font_info['personality']['dominant_traits']]
+
+    # Number of variables
+    N = len(traits)
+
+    # Compute angle for each axis
+    angles = [n / float(N) * 2 * np.pi for n in range(N)]
+    angles += angles[:1]  # Close the loop
+
+    # Add values (and close the loop)
+    values += values[:1]
+
+    # Draw the plot
+    ax.plot(angles, values, linewidth=2, linestyle='solid')
+    ax.fill(angles, values, alpha=0.25)
+
+    # Set labels and title
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(traits)
+    ax.set_title(f"Font Personality Profile: {font_info['font_name']}", size=15, pad=20)
+
+    # Adjust radial limits
+    ax.set_ylim(0, 10)
+
+    # Save or display
+    if output_dir:
+        radar_path = os.path.join(output_dir, f"{font_info['font_name'].replace(' ', '_')}_personality_radar.png")
+        png_bytes = _figure_to_png(fig, dpi=300, bbox_inches='tight')
+        plt.close(fig)
+        return radar_path, png_bytes
+    else:
+        plt.tight_layout()
+        plt.show()
+        return None
+
+def _render_metrics_chart(font_info, output_dir):
+    """Renders the weight and width comparison chart. Returns (path, png_bytes) or None."""
+    import matplotlib.pyplot as plt
+
     # Define standard weights and widths for comparison
     standard_weights = {
         'thin': 100, 
@@ -2121,7 +2211,7 @@ def visualize_font_properties(font_info, output_dir=None):
         'extra bold': 800, 
         'black': 900
     }
-    
+
     standard_widths = {
         'ultra condensed': 1,
         'extra condensed': 2,
@@ -2133,54 +2223,61 @@ def visualize_font_properties(font_info, output_dir=None):
         'extra expanded': 8,
         'ultra expanded': 9
     }
-    
+
     # Get font weight and width
     font_weight_name = font_info['weight']['description'].lower()
     font_width_name = font_info['width']['description'].lower()
-    
+
     # Create comparison bars
     weight_values = list(standard_weights.values())
     width_values = [val * 100 for val in standard_widths.values()]  # Scale for visibility
-    
+
     # Highlight the font's position
     weight_colors = ['lightgray'] * len(standard_weights)
     width_colors = ['lightgray'] * len(standard_widths)
-    
+
     if font_weight_name in standard_weights:
         weight_idx = list(standard_weights.keys()).index(font_weight_name)
         weight_colors[weight_idx] = 'darkblue'
-    
+
     if font_width_name in standard_widths:
         width_idx = list(standard_widths.keys()).index(font_width_name)
         width_colors[width_idx] = 'darkred'
-    
+
     # Create subplots
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
-    
+
     # Plot weight
     ax1.bar(list(standard_weights.keys()), weight_values, color=weight_colors)
     ax1.set_title(f"Font Weight: {font_weight_name.capitalize()}", fontsize=14)
     ax1.set_ylabel("Weight Value")
     plt.setp(ax1.get_xticklabels(), rotation=45, ha='right')
-    
+
     # Plot width
     ax2.bar(list(standard_widths.keys()), width_values, color=width_colors)
     ax2.set_title(f"Font Width: {font_width_name.capitalize()}", fontsize=14)
     ax2.set_ylabel("Width Value")
     plt.setp(ax2.get_xticklabels(), rotation=45, ha='right')
-    
+
     plt.tight_layout()
-    
+
     # Save or display
     if output_dir:
         metrics_path = os.path.join(output_dir, f"{font_info['font_name'].replace(' ', '_')}_metrics.png")
-        plt.savefig(metrics_path, dpi=300, bbox_inches='tight')
-        visualization_paths['metrics_chart'] = metrics_path
+        png_bytes = _figure_to_png(fig, dpi=300, bbox_inches='tight')
         plt.close(fig)
+        return metrics_path, png_bytes
     else:
         plt.show()
-    
-    # 3. Create a sample text rendering
+        return None
+
+def _render_text_sample(font_info, output_dir):
+    """Renders a sample text image using the font file. Returns (path, png_bytes) or None."""
+    import matplotlib.pyplot as plt
+    import numpy as np
+    from PIL import Image, ImageDraw, ImageFont
+    from io import BytesIO
+
     try:
         # Create a sample text image using the font
         font_path = font_info.get('font_path', '')
@@ -2188,38 +2285,39 @@ def visualize_font_properties(font_info, output_dir=None):
             # Sample text
             sample_text = "The quick brown fox jumps over the lazy dog."
             sample_heading = "ABCDEFGHIJKLM"
-            
+
             # Create image
             img_width, img_height = 1000, 400
             img = Image.new('RGB', (img_width, img_height), color='white')
             draw = ImageDraw.Draw(img)
-            
+
             try:
                 # Load font at different sizes
                 heading_font = ImageFont.truetype(font_path, 48)
                 body_font = ImageFont.truetype(font_path, 24)
-                
+
                 # Draw text
                 draw.text((50, 50), sample_heading, font=heading_font, fill='black')
                 draw.text((50, 150), sample_text, font=body_font, fill='black')
                 draw.text((50, 200), sample_text.upper(), font=body_font, fill='black')
                 draw.text((50, 250), "0123456789", font=body_font, fill='black')
-                
+
                 # Add font info
                 info_text = f"Font: {font_info['font_name']} | Weight: {font_info['weight']['description']} | Style: {font_info['style']}"
                 draw.text((50, 320), info_text, fill='gray')
-                
+
                 # Save or display
                 if output_dir:
                     sample_path = os.path.join(output_dir, f"{font_info['font_name'].replace(' ', '_')}_sample.png")
-                    img.save(sample_path)
-                    visualization_paths['text_sample'] = sample_path
+                    buf = BytesIO()
+                    img.save(buf, format='PNG')
+                    return sample_path, buf.getvalue()
                 else:
                     # Convert to BytesIO for display
                     buf = BytesIO()
                     img.save(buf, format='PNG')
                     buf.seek(0)
-                    
+
                     # Display using matplotlib
                     plt.figure(figsize=(10, 4))
                     plt.imshow(np.array(img))
@@ -2231,96 +2329,129 @@ def visualize_font_properties(font_info, output_dir=None):
                 print(f"Error rendering font sample: {e}")
     except Exception as e:
         print(f"Error creating text sample: {e}")
-    
-    # 4. Create suitable use cases visualization
-    if 'personality' in font_info and 'suitable_use_cases' in font_info['personality']:
-        use_cases = font_info['personality']['suitable_use_cases']
-        
-        if 'suitable_for' in use_cases and use_cases['suitable_for']:
-            # Get top use cases
-            suitable = use_cases['suitable_for'][:5]  # Top 5
-            less_suitable = use_cases.get('less_suitable_for', [])[:3]  # Top 3
-            
-            # Create figure
-            fig, ax = plt.subplots(figsize=(10, 6))
-            
-            # Plot suitable use cases in green
-            for i, use_case in enumerate(suitable):
-                ax.barh(i, 0.8, color='green', alpha=0.7)
-                ax.text(0.1, i, use_case, ha='left', va='center', color='black')
-            
-            # Plot less suitable use cases in red (if any)
-            offset = len(suitable) + 1  # Add a gap
-            for i, use_case in enumerate(less_suitable):
-                ax.barh(i + offset, 0.8, color='red', alpha=0.7)
-                ax.text(0.1, i + offset, use_case, ha='left', va='center', color='black')
-            
-            # Set labels and title
-            ax.set_yticks([])
-            ax.set_xticks([])
-            ax.set_xlim(0, 1)
-            
-            # Create legend
-            legend_elements = [
-                Patch(facecolor='green', alpha=0.7, label='Suitable For'),
-                Patch(facecolor='red', alpha=0.7, label='Less Suitable For')
-            ]
-            ax.legend(handles=legend_elements, loc='upper right')
-            
-            ax.set_title(f"Recommended Use Cases: {font_info['font_name']}", fontsize=14)
-            
-            # Remove spines
-            for spine in ax.spines.values():
-                spine.set_visible(False)
-            
-            # Save or display
-            if output_dir:
-                use_cases_path = os.path.join(output_dir, f"{font_info['font_name'].replace(' ', '_')}_use_cases.png")
-                plt.savefig(use_cases_path, dpi=300, bbox_inches='tight')
-                visualization_paths['use_cases'] = use_cases_path
-                plt.close(fig)
-            else:
-                plt.tight_layout()
-                plt.show()
-    
-    return visualization_paths
+    return None
+
+def _render_use_cases(font_info, output_dir):
+    """Renders the suitable use cases chart. Returns (path, png_bytes) or None."""
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Patch
+
+    if 'personality' not in font_info or 'suitable_use_cases' not in font_info['personality']:
+        return None
+
+    use_cases = font_info['personality']['suitable_use_cases']
 
-def create_font_report(font_info, output_dir):
+    if 'suitable_for' not in use_cases or not use_cases['suitable_for']:
+        return None
+
+    # Get top use cases
+    suitable = use_cases['suitable_for'][:5]  # Top 5
+    less_suitable = use_cases.get('less_suitable_for', [])[:3]  # Top 3
+
+    # Create figure
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # Plot suitable use cases in green
+    for i, use_case in enumerate(suitable):
+        ax.barh(i, 0.8, color='green', alpha=0.7)
+        ax.text(0.1, i, use_case, ha='left', va='center', color='black')
+
+    # Plot less suitable use cases in red (if any)
+    offset = len(suitable) + 1  # Add a gap
+    for i, use_case in enumerate(less_suitable):
+        ax.barh(i + offset, 0.8, color='red', alpha=0.7)
+        ax.text(0.1, i + offset, use_case, ha='left', va='center', color='black')
+
+    # Set labels and title
+    ax.set_yticks([])
+    ax.set_xticks([])
+    ax.set_xlim(0, 1)
+
+    # Create legend
+    legend_elements = [
+        Patch(facecolor='green', alpha=0.7, label='Suitable For'),
+        Patch(facecolor='red', alpha=0.7, label='Less Suitable For')
+    ]
+    ax.legend(handles=legend_elements, loc='upper right')
+
+    ax.set_title(f"Recommended Use Cases: {font_info['font_name']}", fontsize=14)
+
+    # Remove spines
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+
+    # Save or display
+    if output_dir:
+        use_cases_path = os.path.join(output_dir, f"{font_info['font_name'].replace(' ', '_')}_use_cases.png")
+        png_bytes = _figure_to_png(fig, dpi=300, bbox_inches='tight')
+        plt.close(fig)
+        return use_cases_path, png_bytes
+    else:
+        plt.tight_layout()
+        plt.show()
+        return None
+
+def visualize_font_properties(font_info, output_dir=None, parallel=True):
     """
-    Create a comprehensive visual report for a font.
-    
+    Create visualizations of font properties and analysis results.
+
+    When output_dir is given, the plot types are rendered in parallel worker
+    processes (each figure is independent), so wall-clock time approaches the
+    slowest single plot instead of the sum of all of them.
+
     Args:
         font_info (dict): Dictionary containing font analysis results
-        output_dir (str): Directory to save the report
-        
+        output_dir (str, optional): Directory to save visualizations. If None, displays them instead.
+        parallel (bool): Render plot types in worker processes. Pass False
+            when already running inside a worker process, where a nested pool
+            would only add overhead.
+
     Returns:
-        str: Path to the generated report HTML file
+        dict: Paths to generated visualization files if output_dir is provided, otherwise None
     """
-    import matplotlib.pyplot as plt
-    import os
-    import base64
-    from io import BytesIO
-    from datetime import datetime
-    
     # Create output directory if needed
-    if not os.path.exists(output_dir):
+    if output_dir and not os.path.exists(output_dir):
         os.makedirs(output_dir)
-    
-    # Generate visualizations
-    viz_paths = visualize_font_properties(font_info, output_dir)
-    
-    # Convert absolute paths to filenames only for use in the HTML
-    viz_filenames = {}
-    if viz_paths:
-        for key, path in viz_paths.items():
-            viz_filenames[key] = os.path.basename(path)
-    
-    # Create HTML report
-    html_content = f"""
+
+    # Dictionary to store paths to visualization files
+    visualization_paths = {}
+
+    if output_dir:
+        if parallel:
+            pool = _get_viz_pool()
+            futures = {plot_type: pool.submit(_render_one, plot_type, font_info, output_dir)
+                       for plot_type in _VIZ_PLOT_TYPES}
+            results = ((plot_type, future.result()) for plot_type, future in futures.items())
+        else:
+            results = ((plot_type, _render_one(plot_type, font_info, output_dir))
+                       for plot_type in _VIZ_PLOT_TYPES)
+        rendered = []
+        for plot_type, result in results:
+            if result:
+                path, png_bytes = result
+                rendered.append((path, png_bytes))
+                visualization_paths[plot_type] = path
+        # All figures were rendered to memory; flush them to disk in one
+        # batched pass instead of a write+wait cycle per figure
+        if rendered:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=len(rendered)) as writers:
+                list(writers.map(_write_png, rendered))
+    else:
+        # Display mode stays serial: figures go to the interactive backend
+        for plot_type in _VIZ_PLOT_TYPES:
+            _render_one(plot_type, font_info, None)
+
+    return visualization_paths
+
+# HTML report skeleton for create_font_report. The template is parsed once at
+# import and filled with a single format_map call; optional blocks below are
+# substituted with an empty string when the corresponding data is missing.
+REPORT_TEMPLATE = """
     <!DOCTYPE html>
     <html>
     <head>
-        <title>Font Analysis Report: {font_info['font_name']}</title>
+        <title>Font Analysis Report: {font_name}</title>
         <style>
             body {{
                 font-family: Arial, sans-serif;
@@ -2381,107 +2512,167 @@ def create_font_report(font_info, output_dir):
     </head>
     <body>
         <div class="header">
-            <h1>Font Analysis Report: {font_info['font_name']}</h1>
-            <p>Format: {font_info['format']} | Style: {font_info['style']}</p>
+            <h1>Font Analysis Report: {font_name}</h1>
+            <p>Format: {font_format} | Style: {font_style}</p>
         </div>
-        
+
         <div class="section">
             <h2>Font Metrics</h2>
             <div class="metrics-grid">
                 <div class="metric-item">
-                    <p>Weight: <span class="metric-value">{font_info['weight']['description']} ({font_info['weight']['class']})</span></p>
+                    <p>Weight: <span class="metric-value">{weight_description} ({weight_class})</span></p>
                 </div>
                 <div class="metric-item">
-                    <p>Width: <span class="metric-value">{font_info['width']['description']} ({font_info['width']['class']})</span></p>
+                    <p>Width: <span class="metric-value">{width_description} ({width_class})</span></p>
                 </div>
-    """
-    
-    # Add stroke width if available
-    if font_info['weight']['stroke_width'] is not None:
-        html_content += f"""
+    {stroke_block}{aspect_block}
                 <div class="metric-item">
-                    <p>Stroke Width: <span class="metric-value">{font_info['weight']['stroke_width']:.2f} units</span></p>
+                    <p>Shape: <span class="metric-value">{shape_type}</span></p>
                 </div>
                 <div class="metric-item">
-                    <p>Normalized Stroke Width: <span class="metric-value">{font_info['weight']['normalized_stroke_width']:.4f}</span></p>
+                    <p>Spacing: <span class="metric-value">{spacing_width_type} width, {spacing_type} spacing</span></p>
                 </div>
-        """
-    
-    # Add aspect ratio if available
-    if font_info['width']['aspect_ratio'] is not None:
-        html_content += f"""
+            </div>
+
+            <div class="viz-container">
+                <img src="{metrics_chart}" alt="Font Metrics Visualization">
+            </div>
+        </div>
+    {personality_section}{sample_section}
+        <div class="footer">
+            <p>Generated by Font Analyzer on {timestamp}</p>
+        </div>
+    </body>
+    </html>
+    """
+
+REPORT_STROKE_BLOCK = """
                 <div class="metric-item">
-                    <p>Aspect Ratio: <span class="metric-value">{font_info['width']['aspect_ratio']:.2f}</span></p>
+                    <p>Stroke Width: <span class="metric-value">{stroke_width:.2f} units</span></p>
                 </div>
-        """
-    
-    # Add shape information
-    html_content += f"""
                 <div class="metric-item">
-                    <p>Shape: <span class="metric-value">{font_info['shape']['type']}</span></p>
+                    <p>Normalized Stroke Width: <span class="metric-value">{normalized_stroke_width:.4f}</span></p>
                 </div>
+        """
+
+REPORT_ASPECT_BLOCK = """
                 <div class="metric-item">
-                    <p>Spacing: <span class="metric-value">{font_info['spacing']['width_type']} width, {font_info['spacing']['spacing_type']} spacing</span></p>
+                    <p>Aspect Ratio: <span class="metric-value">{aspect_ratio:.2f}</span></p>
                 </div>
-            </div>
-            
-            <div class="viz-container">
-                <img src="{viz_filenames.get('metrics_chart', '')}" alt="Font Metrics Visualization">
-            </div>
-        </div>
-    """
-    
-    # Add personality section if available
-    if 'personality' in font_info:
-        html_content += f"""
+        """
+
+REPORT_PERSONALITY_SECTION = """
         <div class="section">
             <h2>Personality Analysis</h2>
-        """
-        
-        if 'emotional_description' in font_info['personality']:
-            html_content += f"""
-            <p><strong>Emotional Description:</strong> {font_info['personality']['emotional_description']}</p>
-            """
-        
-        html_content += f"""
+        {emotional_block}
             <div class="viz-container">
-                <img src="{viz_filenames.get('personality_radar', '')}" alt="Font Personality Radar Chart">
+                <img src="{personality_radar}" alt="Font Personality Radar Chart">
             </div>
+        {use_cases_block}
+        </div>
         """
-        
-        # Add use cases visualization if available
-        if 'use_cases' in viz_paths:
-            html_content += f"""
+
+REPORT_EMOTIONAL_BLOCK = """
+            <p><strong>Emotional Description:</strong> {emotional_description}</p>
+            """
+
+REPORT_USE_CASES_BLOCK = """
             <h3>Recommended Use Cases</h3>
             <div class="viz-container">
-                <img src="{viz_filenames.get('use_cases', '')}" alt="Font Use Cases">
+                <img src="{use_cases}" alt="Font Use Cases">
             </div>
             """
-        
-        html_content += """
-        </div>
-        """
-    
-    # Add sample text section if available
-    if 'text_sample' in viz_paths:
-        html_content += f"""
+
+REPORT_SAMPLE_SECTION = """
         <div class="section">
             <h2>Font Sample</h2>
             <div class="viz-container">
-                <img src="{viz_filenames.get('text_sample', '')}" alt="Font Sample Text">
+                <img src="{text_sample}" alt="Font Sample Text">
             </div>
         </div>
         """
-    
-    # Close HTML
-    html_content += f"""
-        <div class="footer">
-            <p>Generated by Font Analyzer on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        </div>
-    </body>
-    </html>
+
+def create_font_report(font_info, output_dir, parallel=True):
     """
+    Create a comprehensive visual report for a font.
+
+    Args:
+        font_info (dict): Dictionary containing font analysis results
+        output_dir (str): Directory to save the report
+        parallel (bool): Render the embedded visualizations in worker
+            processes; pass False when already inside a worker process.
+
+    Returns:
+        str: Path to the generated report HTML file
+    """
+    import matplotlib.pyplot as plt
+    import os
+    import base64
+    from io import BytesIO
+    from datetime import datetime
+    
+    # Create output directory if needed
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    
+    # Generate visualizations
+    viz_paths = visualize_font_properties(font_info, output_dir, parallel=parallel)
     
+    # Convert absolute paths to filenames only for use in the HTML
+    viz_filenames = {}
+    if viz_paths:
+        for key, path in viz_paths.items():
+            viz_filenames[key] = os.path.basename(path)
+    
+    # Build the HTML report from the module-level template
+    personality_section = ''
+    if 'personality' in font_info:
+        emotional_block = ''
+        if 'emotional_description' in font_info['personality']:
+            emotional_block = REPORT_EMOTIONAL_BLOCK.format(
+                emotional_description=font_info['personality']['emotional_description'])
+
+        use_cases_block = ''
+        if 'use_cases' in viz_paths:
+            use_cases_block = REPORT_USE_CASES_BLOCK.format(
+                use_cases=viz_filenames.get('use_cases', ''))
+
+        personality_section = REPORT_PERSONALITY_SECTION.format(
+            emotional_block=emotional_block,
+            personality_radar=viz_filenames.get('personality_radar', ''),
+            use_cases_block=use_cases_block)
+
+    sample_section = ''
+    if 'text_sample' in viz_paths:
+        sample_section = REPORT_SAMPLE_SECTION.format(
+            text_sample=viz_filenames.get('text_sample', ''))
+
+    context = {
+        'font_name': font_info['font_name'],
+        'font_format': font_info['format'],
+        'font_style': font_info['style'],
+        'weight_description': font_info['weight']['description'],
+        'weight_class': font_info['weight']['class'],
+        'width_description': font_info['width']['description'],
+        'width_class': font_info['width']['class'],
+        'stroke_block': REPORT_STROKE_BLOCK.format(
+            stroke_width=font_info['weight']['stroke_width'],
+            normalized_stroke_width=font_info['weight']['normalized_stroke_width']
+        ) if font_info['weight']['stroke_width'] is not None else '',
+        'aspect_block': REPORT_ASPECT_BLOCK.format(
+            aspect_ratio=font_info['width']['aspect_ratio']
+        ) if font_info['width']['aspect_ratio'] is not None else '',
+        'shape_type': font_info['shape']['type'],
+        'spacing_width_type': font_info['spacing']['width_type'],
+        'spacing_type': font_info['spacing']['spacing_type'],
+        'metrics_chart': viz_filenames.get('metrics_chart', ''),
+        'personality_section': personality_section,
+        'sample_section': sample_section,
+        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+    html_content = REPORT_TEMPLATE.format_map(context)
+
     # Write HTML to file
     report_path = os.path.join(output_dir, f"{font_info['font_name'].replace(' ', '_')}_report.html")
     with open(report_path, 'w') as f:
@@ -1,2 +1,37 @@
-bind = "0.0.0.0:10000"
-workers = 2
+import multiprocessing
+import os
+
+bind = "0.0.0.0:" + os.environ.get("PORT", "10000")
+
+# gthread workers: font analysis mixes C-heavy work (fontTools, matplotlib)
+# that releases the GIL with blocking file I/O, so a few threads per worker
+# overlap concurrent requests without the memory cost of extra processes.
+# Each worker also forks its own visualization and job process pools
+# (cpu - 1 processes apiece), so the worker count is capped — the classic
+# 2*cpu rule would multiply into far more processes than cores.
+worker_class = "gthread"
+workers = min(4, max(2, multiprocessing.cpu_count()))
+threads = 4
+
+
+def post_fork(server, worker):
+    """Spawns the per-worker process pools before request threads start.
+
+    Both pools are lazily created on first use, which would otherwise mean
+    forking from a worker that already has request threads running — a
+    recipe for inherited-lock deadlocks. Constructing a ProcessPoolExecutor
+    is not enough: it only forks its processes on the first submit(), so
+    each pool runs (and waits on) a no-op task here, while the worker is
+    still single-threaded.
+    """
+    import font_validator
+    import web_interface
+
+    for pool in (font_validator._get_viz_pool(),
+                 web_interface._get_job_executor()):
+        pool.submit(os.getpid).result()
+
+# Keep gunicorn's worker heartbeat files on tmpfs so the arbiter never
+# mistakes a slow disk for a dead worker.
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
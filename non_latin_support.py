@@ -7,13 +7,13 @@ allowing analysis of fonts with characters from different writing systems.
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 # Set the backend to 'Agg' which is non-interactive and doesn't require a GUI
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from fontTools.ttLib import TTFont
-from PIL import Image, ImageDraw, ImageFont
 import unicodedata
 
 # Unicode block ranges for different scripts
@@ -55,38 +55,50 @@ SCRIPT_RANGES = {
     ]
 }
 
+# Precomputed control-character flags for every code point covered by
+# SCRIPT_RANGES. Indexing this table replaces a per-character Unicode
+# database lookup (plus category-string allocation) in the scan loop.
+_MAX_SCRIPT_CODE = max(end for ranges in SCRIPT_RANGES.values() for _, end in ranges)
+_IS_CONTROL = np.array(
+    [unicodedata.category(chr(code))[0] == 'C' for code in range(_MAX_SCRIPT_CODE + 1)],
+    dtype=bool
+)
+
+# Candidate (non-control) code points per script, precomputed once so each
+# analysis reduces to a single vectorized membership test per script.
+_SCRIPT_CODES = {
+    script_name: np.concatenate([
+        np.arange(start, end + 1, dtype=np.int64)[~_IS_CONTROL[start:end + 1]]
+        for start, end in ranges
+    ])
+    for script_name, ranges in SCRIPT_RANGES.items()
+}
+
 def detect_supported_scripts(font):
     """
     Detect which scripts are supported by the font.
-    
+
     Args:
         font: A TTFont object.
-        
+
     Returns:
         dict: Dictionary with script names as keys and support level as values.
     """
     supported_scripts = {}
     cmap = font.getBestCmap()
-    
+
     if not cmap:
         return {'error': 'No character map found in font'}
-    
+
+    # Sort the cmap code points once; each script is then one vectorized
+    # membership test instead of a Python loop over every code point.
+    cmap_codes = np.sort(np.fromiter(cmap.keys(), dtype=np.int64, count=len(cmap)))
+
     # Check each script
-    for script_name, ranges in SCRIPT_RANGES.items():
-        char_count = 0
-        supported_chars = 0
-        
-        # Check each range in the script
-        for start, end in ranges:
-            for char_code in range(start, end + 1):
-                # Skip control characters and non-characters
-                if unicodedata.category(chr(char_code)).startswith('C'):
-                    continue
-                
-                char_count += 1
-                if char_code in cmap:
-                    supported_chars += 1
-        
+    for script_name, codes in _SCRIPT_CODES.items():
+        char_count = int(codes.size)
+        supported_chars = int(np.isin(codes, cmap_codes, assume_unique=True).sum())
+
         # Calculate support percentage
         if char_count > 0:
             support_level = supported_chars / char_count
@@ -249,12 +261,19 @@ def analyze_non_latin_support(font_path):
         font = TTFont(font_path)
         supported_scripts = detect_supported_scripts(font)
         
-        # Count fully and partially supported scripts
-        full_support = sum(1 for info in supported_scripts.values() if info['status'] == 'full')
-        partial_support = sum(1 for info in supported_scripts.values() if info['status'] == 'partial')
-        
-        # Determine primary script
-        primary_script = max(supported_scripts.items(), key=lambda x: x[1]['percentage'])[0]
+        # Tally support counts and track the primary script in a single pass
+        full_support = 0
+        partial_support = 0
+        primary_script = None
+        best_percentage = -1.0
+        for script_name, info in supported_scripts.items():
+            if info['status'] == 'full':
+                full_support += 1
+            elif info['status'] == 'partial':
+                partial_support += 1
+            if info['percentage'] > best_percentage:
+                best_percentage = info['percentage']
+                primary_script = script_name
         
         return {
             'supported_scripts': supported_scripts,
@@ -269,6 +288,29 @@ def analyze_non_latin_support(font_path):
             'error': str(e)
         }
 
+def batch_analyze(font_paths, max_workers=None):
+    """
+    Analyze script support for multiple fonts in parallel.
+
+    Each font is analyzed independently, so the work is spread across
+    worker processes with one analysis per font.
+
+    Args:
+        font_paths: List of paths to font files.
+        max_workers: Maximum number of worker processes. Defaults to the CPU count.
+
+    Returns:
+        dict: Mapping of font path to its analysis result from analyze_non_latin_support.
+    """
+    if not font_paths:
+        return {}
+
+    max_workers = max_workers or os.cpu_count()
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(analyze_non_latin_support, font_paths, chunksize=8)
+        return dict(zip(font_paths, results))
+
 def integrate_non_latin_analysis(font_info, font_path):
     """
     Integrate non-Latin script analysis into the main font_info dictionary.
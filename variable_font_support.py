@@ -8,32 +8,103 @@ including axis information, design space analysis, and instance rendering.
 """
 
 import os
+import itertools
 import numpy as np
-# Set the backend to 'Agg' which is non-interactive and doesn't require a GUI
+# Use the Agg canvas directly through the object-oriented API; this keeps
+# matplotlib non-interactive and skips pyplot's figure-manager state machine
 import matplotlib
 matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from fontTools.ttLib import TTFont
 from fontTools.varLib.instancer import instantiateVariableFont
+from fontTools.subset import Subsetter, Options as SubsetOptions
 from PIL import Image, ImageDraw, ImageFont
-import tempfile
-import shutil
+import types
+import io
+import mmap
+import hashlib
+from copy import copy, deepcopy
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+# Fallback display names for registered axis tags, used when an axis name
+# cannot be resolved from the font's name table
+_COMMON_AXIS_NAMES = types.MappingProxyType({
+    'wght': 'Weight',
+    'wdth': 'Width',
+    'ital': 'Italic',
+    'slnt': 'Slant',
+    'opsz': 'Optical Size',
+    'GRAD': 'Grade',
+    'XTRA': 'X Transparency',
+    'XOPQ': 'X Opaque',
+    'YOPQ': 'Y Opaque',
+    'YTLC': 'Y Transparent Lowercase',
+    'YTUC': 'Y Transparent Uppercase'
+})
+
+@lru_cache(maxsize=32)
+def _load_font_cached(font_path, mtime):
+    """
+    Parse a font once per (path, mtime) and share it across the module's
+    entry points. integrate_variable_font_analysis otherwise re-opens and
+    re-parses the same file four or five times per font; the mtime key
+    invalidates the cache when the file changes on disk.
+
+    The file is memory-mapped rather than read into a bytes object, so the
+    kernel only pages in the table ranges the lazy parser actually touches.
+    The file descriptor is closed immediately (the mapping survives it); the
+    mapping itself lives until the entry is evicted or clear_font_cache runs.
+    """
+    with open(font_path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return TTFont(mapped, lazy=True)
+
+def clear_font_cache():
+    """
+    Close the cached fonts and drop the module's caches.
+
+    Long batch runs can call this between batches to release the mmaps and
+    decompiled tables pinned by the font cache; dropping the cached entries
+    closes the mappings as soon as nothing else references the fonts.
+    """
+    _extract_variable_font_info_cached.cache_clear()
+    _cached_pil_font.cache_clear()
+    _load_font_cached.cache_clear()
+
+def _open_font(font_path):
+    """Return the cached, lazily parsed TTFont for font_path."""
+    return _load_font_cached(font_path, os.path.getmtime(font_path))
+
+# sfnt version tags for plain TrueType/OpenType files whose table directory
+# can be scanned directly; TTC and WOFF containers need real parsing
+_SFNT_VERSIONS = (b'\x00\x01\x00\x00', b'OTTO', b'true')
 
 def is_variable_font(font_path):
     """
     Check if a font is a variable font by examining its tables.
-    
+
     Args:
         font_path (str): Path to the font file.
-        
+
     Returns:
         bool: True if the font is a variable font, False otherwise.
     """
     try:
-        font = TTFont(font_path)
-        # Variable fonts must have 'fvar' table
-        return 'fvar' in font
+        # Variable fonts must have an 'fvar' table, and the sfnt header lists
+        # every table tag up front: scanning the 16-byte directory records is
+        # a few hundred bytes of I/O against constructing a TTFont
+        with open(font_path, 'rb') as f:
+            header = f.read(12)
+            if len(header) == 12 and header[:4] in _SFNT_VERSIONS:
+                num_tables = int.from_bytes(header[4:6], 'big')
+                records = f.read(16 * num_tables)
+                return any(records[offset:offset + 4] == b'fvar'
+                           for offset in range(0, len(records), 16))
+
+        # Not a bare sfnt (TTC/WOFF/WOFF2): fall back to the parser
+        return 'fvar' in _open_font(font_path)
     except Exception as e:
         print(f"Error checking if font is variable: {e}")
         return False
@@ -41,22 +112,51 @@ def is_variable_font(font_path):
 def extract_variable_font_info(font_path):
     """
     Extract information about a variable font's axes and instances.
-    
+
     Args:
         font_path (str): Path to the variable font file.
-        
+
     Returns:
         dict: Information about the variable font's axes and named instances.
+        Treat the result as read-only: it is cached and shared between calls.
     """
     try:
-        font = TTFont(font_path)
-        
+        return _extract_variable_font_info_cached(font_path, os.path.getmtime(font_path))
+    except Exception as e:
+        print(f"Error extracting variable font info: {e}")
+        return {'is_variable': False, 'error': str(e)}
+
+@lru_cache(maxsize=32)
+def _extract_variable_font_info_cached(font_path, mtime):
+    """Do the fvar/name walk once per (path, mtime); see extract_variable_font_info."""
+    try:
+        font = _load_font_cached(font_path, mtime)
+
         if 'fvar' not in font:
             return {'is_variable': False, 'error': 'Not a variable font'}
-        
+
         fvar = font['fvar']
         axes = {}
         
+        # Resolve every name ID in a single pass over the name table;
+        # getDebugName does a linear record scan per lookup, which adds up
+        # across axes and named instances. Mirror its preference: an English
+        # record (Windows 0x409 or Mac 0) wins and locks the entry, otherwise
+        # later records keep overwriting earlier ones.
+        name_map = {}
+        english_ids = set()
+        if 'name' in font:
+            for record in font['name'].names:
+                if record.nameID in english_ids:
+                    continue
+                try:
+                    text = record.toUnicode()
+                except UnicodeDecodeError:
+                    continue
+                name_map[record.nameID] = text
+                if (record.platformID, record.langID) in ((3, 0x409), (1, 0)):
+                    english_ids.add(record.nameID)
+        
         # Extract axis information
         for axis in fvar.axes:
             axis_tag = axis.axisTag
@@ -67,32 +167,23 @@ def extract_variable_font_info(font_path):
                 'max_value': axis.maxValue
             }
             
-            # Try to get the actual name from the name table
-            if hasattr(font['name'], 'getDebugName'):
-                axes[axis_tag]['name'] = font['name'].getDebugName(axis.axisNameID) or axis.axisTag
-            else:
-                # Fallback to common axis names
-                common_names = {
-                    'wght': 'Weight',
-                    'wdth': 'Width',
-                    'ital': 'Italic',
-                    'slnt': 'Slant',
-                    'opsz': 'Optical Size',
-                    'GRAD': 'Grade',
-                    'XTRA': 'X Transparency',
-                    'XOPQ': 'X Opaque',
-                    'YOPQ': 'Y Opaque',
-                    'YTLC': 'Y Transparent Lowercase',
-                    'YTUC': 'Y Transparent Uppercase'
-                }
-                axes[axis_tag]['name'] = common_names.get(axis_tag, axis_tag)
+            # Use the name-table entry, falling back to the common
+            # registered axis names
+            axes[axis_tag]['name'] = (name_map.get(axis.axisNameID)
+                                      or _COMMON_AXIS_NAMES.get(axis_tag, axis_tag))
         
         # Extract named instances
         named_instances = []
         if hasattr(fvar, 'instances'):
+            axis_tags = tuple(axis.axisTag for axis in fvar.axes)
             for instance in fvar.instances:
-                instance_name = font['name'].getDebugName(instance.subfamilyNameID)
-                coordinates = {axis.axisTag: instance.coordinates[i] for i, axis in enumerate(fvar.axes)}
+                instance_name = name_map.get(instance.subfamilyNameID)
+                # fontTools keys instance.coordinates by axis tag; older
+                # versions stored a list parallel to fvar.axes
+                if isinstance(instance.coordinates, dict):
+                    coordinates = dict(instance.coordinates)
+                else:
+                    coordinates = dict(zip(axis_tags, instance.coordinates))
                 named_instances.append({
                     'name': instance_name,
                     'coordinates': coordinates
@@ -107,56 +198,53 @@ def extract_variable_font_info(font_path):
         print(f"Error extracting variable font info: {e}")
         return {'is_variable': False, 'error': str(e)}
 
-def analyze_variable_font_design_space(font_path):
+def analyze_variable_font_design_space(font_path, detail='full'):
     """
     Analyze the design space of a variable font.
     
     Args:
         font_path (str): Path to the variable font file.
+        detail (str, optional): 'full' includes per-axis ranges and axis
+            interactions; 'summary' skips them for callers that only read
+            the design space size.
         
     Returns:
         dict: Analysis of the variable font's design space.
     """
     try:
-        font = TTFont(font_path)
+        font = _open_font(font_path)
         
         if 'fvar' not in font:
             return {'is_variable': False, 'error': 'Not a variable font'}
         
         fvar = font['fvar']
+        tags = [axis.axisTag for axis in fvar.axes]
+        
+        # Calculate design space size (number of possible combinations).
+        # Continuous axes like weight have about 9 meaningful steps, binary
+        # axes like italic only 2, so the size follows in closed form.
+        binary_axes = sum(1 for tag in tags if tag == 'ital')
+        design_space_size = (9 ** (len(tags) - binary_axes)) * (2 ** binary_axes)
+        
+        if detail == 'summary':
+            return {
+                'is_variable': True,
+                'design_space_size': design_space_size,
+                'has_stat_table': 'STAT' in font
+            }
         
-        # Calculate design space size (number of possible combinations)
-        design_space_size = 1
-        axis_ranges = []
-        
-        for axis in fvar.axes:
-            # Estimate number of meaningful steps for this axis
-            # For continuous axes like weight, about 9 steps are meaningful
-            # For binary axes like italic, only 2 steps are meaningful
-            if axis.axisTag in ['ital']:
-                steps = 2
-            else:
-                steps = 9
-            
-            design_space_size *= steps
-            axis_ranges.append({
-                'tag': axis.axisTag,
-                'range': axis.maxValue - axis.minValue,
-                'steps': steps
-            })
+        axis_ranges = [{
+            'tag': axis.axisTag,
+            'range': axis.maxValue - axis.minValue,
+            'steps': 2 if axis.axisTag == 'ital' else 9
+        } for axis in fvar.axes]
         
         # Analyze axis interactions
-        axis_interactions = []
-        if len(fvar.axes) > 1:
-            for i in range(len(fvar.axes)):
-                for j in range(i+1, len(fvar.axes)):
-                    axis1 = fvar.axes[i]
-                    axis2 = fvar.axes[j]
-                    axis_interactions.append({
-                        'axis1': axis1.axisTag,
-                        'axis2': axis2.axisTag,
-                        'interaction_type': 'orthogonal'  # Most variable fonts have orthogonal axes
-                    })
+        # Most variable fonts have orthogonal axes
+        axis_interactions = [
+            {'axis1': tag1, 'axis2': tag2, 'interaction_type': 'orthogonal'}
+            for tag1, tag2 in itertools.combinations(tags, 2)
+        ]
         
         # Check for STAT table which provides additional style attributes
         has_stat = 'STAT' in font
@@ -197,7 +285,9 @@ def visualize_variable_font_axes(font_path, output_dir=None):
             return None
         
         # Create a figure for the axes visualization
-        fig, axes_plots = plt.subplots(len(var_info['axes']), 1, figsize=(10, 2 * len(var_info['axes'])))
+        fig = Figure(figsize=(10, 2 * len(var_info['axes'])))
+        FigureCanvasAgg(fig)
+        axes_plots = fig.subplots(len(var_info['axes']), 1)
         
         # Handle case with only one axis
         if len(var_info['axes']) == 1:
@@ -231,25 +321,118 @@ def visualize_variable_font_axes(font_path, output_dir=None):
                                   for instance in var_info['named_instances']]
                 instance_names = [instance['name'] for instance in var_info['named_instances']]
                 
-                # Plot instance markers
+                # Plot all instance markers with a single scatter call and
+                # label them with plain ax.text, which skips annotate's
+                # per-call arrow/transform machinery
+                ax.scatter(instance_values, [0.5] * len(instance_values),
+                           marker='x', c='b', s=64)
                 for val, name in zip(instance_values, instance_names):
-                    ax.plot([val], [0.5], 'bx', markersize=8)
-                    ax.annotate(name, (val, 0.6), rotation=45, ha='right', fontsize=8)
+                    ax.text(val, 0.6, name, rotation=45, ha='right', fontsize=8)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save the visualization
         font_name = os.path.splitext(os.path.basename(font_path))[0]
         output_path = os.path.join(output_dir, f"{font_name}_variable_axes.png")
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
+        fig.savefig(output_path, dpi=150)
         
         return output_path
     except Exception as e:
         print(f"Error visualizing variable font axes: {e}")
         return None
 
-def render_variable_font_samples(font_path, output_dir=None, sample_text="AaBbCcGgRr 0123"):
+# Tables the instancer (or the attribute fix-ups it performs) may mutate,
+# plus loca/maxp, which glyf.compile() writes into during save. Everything
+# else — cmap, kerning, metadata tables the instancer never touches — is
+# shared by reference between the base font and its copies.
+_INSTANCED_TABLES = frozenset([
+    'glyf', 'loca', 'maxp', 'gvar', 'cvar', 'cvt ', 'fvar', 'avar', 'HVAR',
+    'VVAR', 'MVAR', 'STAT', 'CFF2', 'hmtx', 'vmtx', 'hhea', 'vhea', 'OS/2',
+    'head', 'post', 'name', 'GDEF', 'GPOS', 'GSUB'
+])
+
+def _copy_for_instancing(base_font):
+    """
+    Make a cheap per-instance copy of base_font: deep-copy only the tables
+    instantiateVariableFont can mutate and share the rest by reference.
+    """
+    font_copy = copy(base_font)
+    font_copy.tables = {
+        tag: deepcopy(table) if tag in _INSTANCED_TABLES else table
+        for tag, table in base_font.tables.items()
+    }
+    return font_copy
+
+def _instantiate_pil_font(base_font, coordinates, size=36):
+    """
+    Instantiate a copy of base_font at the given axis coordinates and load
+    it as a PIL font, entirely in memory.
+
+    Args:
+        base_font (TTFont): Fully parsed variable font to instantiate from.
+        coordinates (dict): Axis coordinates for the instance.
+        size (int, optional): Point size for the PIL font.
+
+    Returns:
+        PIL.ImageFont.FreeTypeFont: The instantiated font.
+    """
+    instance = _copy_for_instancing(base_font)
+    instantiateVariableFont(instance, coordinates, inplace=True)
+    buffer = io.BytesIO()
+    instance.save(buffer)
+    return _cached_pil_font(hashlib.blake2b(buffer.getvalue(), digest_size=8).digest(),
+                            buffer.getvalue(), size)
+
+@lru_cache(maxsize=64)
+def _cached_pil_font(digest, data, size):
+    """
+    FreeType face cache keyed by (font-bytes digest, size).
+
+    Re-rendering the same instance (e.g. varying sample_text in a batch)
+    otherwise pays FreeType face creation again; the short digest keeps the
+    cache key cheap to compare while the raw bytes ride along for the miss
+    path.
+    """
+    return ImageFont.truetype(io.BytesIO(data), size)
+
+def _render_sample_batch(base_font, coordinate_list, sample_text):
+    """
+    Render sample_text at each coordinate set and return one 100x500 RGB
+    array per cell.
+
+    Instantiation and FreeType face creation run on a thread pool; the text
+    is then drawn into horizontal bands of one shared canvas, which is
+    sliced into per-cell views rather than allocating an image per cell.
+
+    Args:
+        base_font (TTFont): Fully parsed variable font to instantiate from.
+        coordinate_list (list): Axis coordinate dicts, one per cell.
+        sample_text (str): Text to render.
+
+    Returns:
+        numpy.ndarray: Array of shape (len(coordinate_list), 100, 500, 3).
+    """
+    def load(coordinates):
+        try:
+            return _instantiate_pil_font(base_font, coordinates)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        pil_fonts = list(executor.map(load, coordinate_list))
+
+    canvas = Image.new('RGB', (500, 100 * len(coordinate_list)), color='white')
+    draw = ImageDraw.Draw(canvas)
+    for k, pil_font in enumerate(pil_fonts):
+        if isinstance(pil_font, Exception):
+            draw.text((10, 100 * k + 10), f"Error: {str(pil_font)}", fill='red')
+        else:
+            draw.text((10, 100 * k + 10), sample_text, font=pil_font, fill='black')
+
+    return np.asarray(canvas).reshape(len(coordinate_list), 100, 500, 3)
+
+def render_variable_font_samples(font_path, output_dir=None, sample_text="AaBbCcGgRr 0123",
+                                 subset_to_sample=True):
     """
     Render samples of a variable font at different axis settings.
     
@@ -257,6 +440,8 @@ def render_variable_font_samples(font_path, output_dir=None, sample_text="AaBbCc
         font_path (str): Path to the variable font file.
         output_dir (str, optional): Directory to save visualizations.
         sample_text (str, optional): Text to render.
+        subset_to_sample (bool, optional): Subset the font to sample_text's
+            glyphs before instancing. Disable to instantiate the full font.
         
     Returns:
         str: Path to the generated visualization file.
@@ -274,8 +459,24 @@ def render_variable_font_samples(font_path, output_dir=None, sample_text="AaBbCc
         if not var_info.get('is_variable', False):
             return None
         
-        # Create a temporary directory for font instances
-        temp_dir = tempfile.mkdtemp()
+        # Parse the font once; every instance is derived from this copy.
+        # Decompile everything up front so worker threads only read it;
+        # keeping the head timestamp fixed makes the saved instance bytes
+        # deterministic so the PIL font cache can hit.
+        base_font = TTFont(font_path, lazy=False, recalcTimestamp=False)
+        base_font.ensureDecompiled()
+        
+        # Subset to the glyphs actually rendered so the per-cell instancer
+        # walks a dozen glyphs instead of the whole glyf/gvar tables
+        if subset_to_sample:
+            try:
+                options = SubsetOptions()
+                options.layout_features = ['*']
+                subsetter = Subsetter(options=options)
+                subsetter.populate(text=sample_text)
+                subsetter.subset(base_font)
+            except Exception as e:
+                print(f"Warning: could not subset font before rendering: {e}")
         
         # Get the main axes to visualize (usually weight and width)
         main_axes = []
@@ -295,37 +496,29 @@ def render_variable_font_samples(font_path, output_dir=None, sample_text="AaBbCc
             rows = int(np.ceil(np.sqrt(len(instances))))
             cols = int(np.ceil(len(instances) / rows))
             
-            fig, axs = plt.subplots(rows, cols, figsize=(cols * 4, rows * 2))
-            axs = axs.flatten() if isinstance(axs, np.ndarray) else [axs]
+            # Lay the whole grid out on a single axes: each sample is placed
+            # with imshow(extent=...) and labelled with ax.text, so figure
+            # setup stays O(1) no matter how many instances the font has
+            fig = Figure(figsize=(cols * 4, rows * 2))
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot(111)
             
-            for i, instance in enumerate(instances):
-                if i < len(axs):
-                    # Create an instance of the font
-                    instance_path = os.path.join(temp_dir, f"instance_{i}.ttf")
-                    font = TTFont(font_path)
-                    instantiateVariableFont(font, instance['coordinates'])
-                    font.save(instance_path)
-                    
-                    # Render text using PIL
-                    img = Image.new('RGB', (500, 100), color='white')
-                    draw = ImageDraw.Draw(img)
-                    try:
-                        pil_font = ImageFont.truetype(instance_path, 36)
-                        draw.text((10, 10), sample_text, font=pil_font, fill='black')
-                    except Exception as e:
-                        draw.text((10, 10), f"Error: {str(e)}", fill='red')
-                    
-                    # Convert to numpy array for matplotlib
-                    img_array = np.array(img)
-                    
-                    # Display in the subplot
-                    axs[i].imshow(img_array)
-                    axs[i].set_title(instance['name'])
-                    axs[i].axis('off')
+            # Instantiate and render the cells; the matplotlib calls stay
+            # on the main thread
+            coordinate_list = [instance['coordinates'] for instance in instances]
+            images = _render_sample_batch(base_font, coordinate_list, sample_text)
+            
+            for k, (instance, img_array) in enumerate(zip(instances, images)):
+                i, j = divmod(k, cols)
+                
+                # Place the sample in its grid cell, leaving headroom for the label
+                ax.imshow(img_array, extent=(j + 0.02, j + 0.98, rows - i - 0.95, rows - i - 0.25),
+                          aspect='auto', interpolation='none')
+                ax.text(j + 0.5, rows - i - 0.12, instance['name'], ha='center', va='center')
             
-            # Hide unused subplots
-            for i in range(len(instances), len(axs)):
-                axs[i].axis('off')
+            ax.set_xlim(0, cols)
+            ax.set_ylim(0, rows)
+            ax.set_axis_off()
         
         else:
             # If no named instances, create a grid of samples for the main axes
@@ -338,29 +531,17 @@ def render_variable_font_samples(font_path, output_dir=None, sample_text="AaBbCc
                 steps = 5
                 values = np.linspace(axis_info['min_value'], axis_info['max_value'], steps)
                 
-                fig, axs = plt.subplots(steps, 1, figsize=(8, steps * 1.5))
+                fig = Figure(figsize=(8, steps * 1.5))
+                FigureCanvasAgg(fig)
+                axs = fig.subplots(steps, 1)
                 
-                for i, val in enumerate(values):
-                    # Create an instance of the font
-                    instance_path = os.path.join(temp_dir, f"instance_{i}.ttf")
-                    font = TTFont(font_path)
-                    instantiateVariableFont(font, {axis_tag: val})
-                    font.save(instance_path)
-                    
-                    # Render text using PIL
-                    img = Image.new('RGB', (500, 100), color='white')
-                    draw = ImageDraw.Draw(img)
-                    try:
-                        pil_font = ImageFont.truetype(instance_path, 36)
-                        draw.text((10, 10), sample_text, font=pil_font, fill='black')
-                    except Exception as e:
-                        draw.text((10, 10), f"Error: {str(e)}", fill='red')
-                    
-                    # Convert to numpy array for matplotlib
-                    img_array = np.array(img)
-                    
+                # Instantiate and render the cells
+                coordinate_list = [{axis_tag: val} for val in values]
+                images = _render_sample_batch(base_font, coordinate_list, sample_text)
+                
+                for i, (val, img_array) in enumerate(zip(values, images)):
                     # Display in the subplot
-                    axs[i].imshow(img_array)
+                    axs[i].imshow(img_array, interpolation='none')
                     axs[i].set_title(f"{axis_info['name']}: {val:.1f}")
                     axs[i].axis('off')
             
@@ -375,50 +556,43 @@ def render_variable_font_samples(font_path, output_dir=None, sample_text="AaBbCc
                 values1 = np.linspace(axis1_info['min_value'], axis1_info['max_value'], steps)
                 values2 = np.linspace(axis2_info['min_value'], axis2_info['max_value'], steps)
                 
-                fig, axs = plt.subplots(steps, steps, figsize=(steps * 3, steps * 2))
+                fig = Figure(figsize=(steps * 3, steps * 2))
+                FigureCanvasAgg(fig)
+                axs = fig.subplots(steps, steps)
+                
+                # One contiguous (steps*steps, 2) array of coordinate pairs;
+                # row k maps back to cell divmod(k, steps)
+                grid = np.stack(np.meshgrid(values1, values2, indexing='ij'), -1).reshape(-1, 2)
+                coordinate_list = [{axis1_tag: val1, axis2_tag: val2} for val1, val2 in grid]
                 
-                for i, val1 in enumerate(values1):
-                    for j, val2 in enumerate(values2):
-                        # Create an instance of the font
-                        instance_path = os.path.join(temp_dir, f"instance_{i}_{j}.ttf")
-                        font = TTFont(font_path)
-                        instantiateVariableFont(font, {axis1_tag: val1, axis2_tag: val2})
-                        font.save(instance_path)
-                        
-                        # Render text using PIL
-                        img = Image.new('RGB', (500, 100), color='white')
-                        draw = ImageDraw.Draw(img)
-                        try:
-                            pil_font = ImageFont.truetype(instance_path, 36)
-                            draw.text((10, 10), sample_text, font=pil_font, fill='black')
-                        except Exception as e:
-                            draw.text((10, 10), f"Error: {str(e)}", fill='red')
-                        
-                        # Convert to numpy array for matplotlib
-                        img_array = np.array(img)
-                        
-                        # Display in the subplot
-                        axs[i, j].imshow(img_array)
-                        axs[i, j].set_title(f"{axis1_tag}: {val1:.1f}, {axis2_tag}: {val2:.1f}", fontsize=8)
-                        axs[i, j].axis('off')
-        
-        plt.tight_layout()
+                # Instantiate and render the cells
+                images = _render_sample_batch(base_font, coordinate_list, sample_text)
+                
+                for k, img_array in enumerate(images):
+                    i, j = divmod(k, steps)
+                    val1, val2 = values1[i], values2[j]
+                    
+                    # Display in the subplot
+                    axs[i, j].imshow(img_array, interpolation='none')
+                    axs[i, j].set_title(f"{axis1_tag}: {val1:.1f}, {axis2_tag}: {val2:.1f}", fontsize=8)
+                    axs[i, j].axis('off')
+        
+        fig.tight_layout()
         
         # Save the visualization
         font_name = os.path.splitext(os.path.basename(font_path))[0]
         output_path = os.path.join(output_dir, f"{font_name}_variable_samples.png")
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
+        fig.savefig(output_path, dpi=150)
         
-        # Clean up temporary directory
-        shutil.rmtree(temp_dir)
+        # Release the render font's file handle
+        base_font.close()
         
         return output_path
     except Exception as e:
         print(f"Error rendering variable font samples: {e}")
-        # Clean up temporary directory if it exists
-        if 'temp_dir' in locals():
-            shutil.rmtree(temp_dir)
+        # Release the font if it was loaded
+        if 'base_font' in locals():
+            base_font.close()
         return None
 
 def integrate_variable_font_analysis(font_info, font_path):
@@ -443,8 +617,8 @@ def integrate_variable_font_analysis(font_info, font_path):
         if not var_info.get('is_variable', False):
             return font_info
         
-        # Analyze design space
-        design_space = analyze_variable_font_design_space(font_path)
+        # Analyze design space (the summary is all this integration reads)
+        design_space = analyze_variable_font_design_space(font_path, detail='summary')
         
         # Add variable font information to font_info
         font_info['is_variable_font'] = True
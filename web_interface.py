@@ -10,22 +10,32 @@ allowing users to upload and analyze fonts through a browser.
 import matplotlib
 matplotlib.use('Agg')
 
+import hashlib
+import json
 import os
+import re
+import queue
 import tempfile
-import uuid
+import secrets
+import threading
+import time
 import traceback
 import logging
-from flask import Flask, request, render_template, redirect, url_for, send_from_directory, flash, jsonify
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+import mimetypes
+from flask import Flask, request, render_template, redirect, url_for, send_from_directory, flash, jsonify, make_response
 from werkzeug.utils import secure_filename
 import werkzeug.exceptions
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG, 
+# Configure logging. Default to INFO so the hot paths don't pay for trace
+# spam; FONT_VALIDATOR_DEBUG=1 turns the detailed tracing back on.
+logging.basicConfig(level=logging.DEBUG if os.environ.get('FONT_VALIDATOR_DEBUG') == '1' else logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # Import font validator modules
-from font_validator import extract_font_properties, visualize_font_properties, create_font_report
+from font_validator import extract_font_properties, visualize_font_properties, create_font_report, clear_ttfont_cache
 
 # Check for variable font support
 try:
@@ -46,33 +56,214 @@ app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'dev_key_for_font_validator')
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max upload size
 
-# Configure upload folder
-UPLOAD_FOLDER = os.path.join(tempfile.gettempdir(), 'font_validator_uploads')
-RESULTS_FOLDER = os.path.join(tempfile.gettempdir(), 'font_validator_results')
-ALLOWED_EXTENSIONS = {'ttf', 'otf', 'woff', 'woff2'}
+# Configure upload folder. With FONT_VALIDATOR_USE_SHM=1 the work folders go
+# on /dev/shm (always tmpfs on Linux), so savefig and served downloads never
+# touch disk; opt-in because tmpfs trades memory for the speedup. On many
+# distros /tmp is tmpfs already, in which case this makes no difference.
+_SCRATCH_DIR = tempfile.gettempdir()
+if os.environ.get('FONT_VALIDATOR_USE_SHM') == '1':
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        _SCRATCH_DIR = '/dev/shm'
+    else:
+        logger.warning("FONT_VALIDATOR_USE_SHM=1 but /dev/shm is not writable, using %s", _SCRATCH_DIR)
+
+UPLOAD_FOLDER = os.path.join(_SCRATCH_DIR, 'font_validator_uploads')
+RESULTS_FOLDER = os.path.join(_SCRATCH_DIR, 'font_validator_results')
+CACHE_FOLDER = os.path.join(RESULTS_FOLDER, 'cache')
+JOBS_FOLDER = os.path.join(RESULTS_FOLDER, 'jobs')
+ALLOWED_EXTENSIONS = frozenset({'ttf', 'otf', 'woff', 'woff2'})
 
 # Create folders if they don't exist
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(RESULTS_FOLDER, exist_ok=True)
+os.makedirs(CACHE_FOLDER, exist_ok=True)
+os.makedirs(JOBS_FOLDER, exist_ok=True)
 
 # Create necessary directories
 os.makedirs('font_reports', exist_ok=True)
 os.makedirs('font_visualizations', exist_ok=True)
 
-logger.info(f"Upload folder: {UPLOAD_FOLDER}")
-logger.info(f"Results folder: {RESULTS_FOLDER}")
+logger.info("Upload folder: %s", UPLOAD_FOLDER)
+logger.info("Results folder: %s", RESULTS_FOLDER)
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['RESULTS_FOLDER'] = RESULTS_FOLDER
 
+# With FONT_VALIDATOR_ACCEL=1, download_file answers with an X-Accel-Redirect
+# header and lets the fronting nginx stream the artifact itself, so the Python
+# worker is tied up for microseconds instead of the whole transfer. Requires:
+#   location /internal-results/ { internal; alias <RESULTS_FOLDER>/; }
+USE_ACCEL_REDIRECT = os.environ.get('FONT_VALIDATOR_ACCEL') == '1'
+
+# In-memory hand-off of upload bytes to the follow-up analyze request, keyed
+# by the unique filename. Bounded so uploads can't grow memory without limit;
+# the on-disk copy remains the fallback when an entry has been evicted (or
+# when the redirect lands on a different gunicorn worker).
+UPLOAD_CACHE = OrderedDict()
+UPLOAD_CACHE_MAX = 16
+
+# Background analysis jobs. Heavy work goes to a bounded worker pool so a
+# burst of requests sheds load with 503s instead of queueing unboundedly and
+# starving the WSGI workers; clients poll /status/<job_id> for the result.
+# Job state lives in JSON files under JOBS_FOLDER (like the analysis cache)
+# so a poll can land on any gunicorn worker, not just the accepting one.
+_JOB_WORKERS = max(2, (os.cpu_count() or 2) - 1)
+_JOB_EXECUTOR = None
+_JOB_SLOTS = threading.BoundedSemaphore(_JOB_WORKERS * 4)
+_JOB_ID_RE = re.compile(r'[A-Za-z0-9_-]+\Z')
+_JOB_STATE_MAX_AGE = 3600  # seconds before an unpolled job state is dropped
+
+def _get_job_executor():
+    """Returns the lazily created process pool for background analysis."""
+    global _JOB_EXECUTOR
+    if _JOB_EXECUTOR is None:
+        _JOB_EXECUTOR = ProcessPoolExecutor(max_workers=_JOB_WORKERS)
+    return _JOB_EXECUTOR
+
+def _job_state_path(job_id):
+    """Return the shared state file for a job id."""
+    return os.path.join(JOBS_FOLDER, job_id + '.json')
+
+def _write_job_state(job_id, state):
+    """Persist job state where every worker process can see it."""
+    tmp_path = _job_state_path(job_id) + '.tmp'
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        # Atomic replace so a concurrent poll never reads a half-written file
+        os.replace(tmp_path, _job_state_path(job_id))
+    except (OSError, TypeError) as e:
+        logger.warning("Could not write job state for %s: %s", job_id, e)
+
+def _record_job_result(job_id, future):
+    """Done-callback: write the finished job's outcome to the shared state."""
+    _JOB_SLOTS.release()
+    try:
+        result = future.result()
+    except Exception as e:
+        logger.error("Job %s failed: %s", job_id, e)
+        _write_job_state(job_id, {'state': 'failed', 'error': str(e)})
+        return
+    if 'error' in result:
+        _write_job_state(job_id, {'state': 'failed', 'error': result['error']})
+    else:
+        _write_job_state(job_id, {'state': 'done', 'result': result})
+
+def _prune_job_states():
+    """Drop never-polled job state files so the folder stays bounded."""
+    cutoff = time.time() - _JOB_STATE_MAX_AGE
+    try:
+        for entry in os.scandir(JOBS_FOLDER):
+            if entry.stat().st_mtime < cutoff:
+                logger.debug("Evicting stale job state %s", entry.name)
+                os.unlink(entry.path)
+    except OSError:
+        pass
+
+def _analyze_job(data, filename, generate_visualization=False, generate_report=False):
+    """Run the full analysis pipeline for a queued job in a worker process."""
+    font_properties = extract_font_properties(data, filename=filename)
+    if not font_properties:
+        return {'error': 'Failed to analyze font'}
+    result = {'font_properties': font_properties, 'viz_paths': {}, 'report_path': None}
+    if generate_visualization or generate_report:
+        output_dir = os.path.join(RESULTS_FOLDER, filename.split('.')[0])
+        os.makedirs(output_dir, exist_ok=True)
+        if generate_visualization:
+            # Already in a pool worker; a nested process pool would only
+            # add overhead (and hang interpreter shutdown)
+            full_viz_paths = visualize_font_properties(font_properties, output_dir, parallel=False)
+            result['viz_paths'] = {k: os.path.relpath(v, RESULTS_FOLDER)
+                                   for k, v in (full_viz_paths or {}).items()}
+        if generate_report:
+            full_report_path = create_font_report(font_properties, output_dir, parallel=False)
+            if full_report_path:
+                result['report_path'] = os.path.relpath(full_report_path, RESULTS_FOLDER)
+    return result
+
+# Pre-allocated 1MB read buffers, checked out per request, so sustained
+# upload load reuses the same memory instead of allocating and discarding a
+# fresh chunk buffer on every read
+_READ_BUFFER_POOL = queue.Queue(maxsize=8)
+for _ in range(8):
+    _READ_BUFFER_POOL.put(memoryview(bytearray(1 << 20)))
+
+def _read_stream(stream):
+    """Drain a file-like stream into bytes using a pooled read buffer."""
+    if not hasattr(stream, 'readinto'):
+        # werkzeug backs multipart parts with SpooledTemporaryFile, which
+        # only grew readinto() in Python 3.11; fall back to chunked reads
+        data = bytearray()
+        while True:
+            chunk = stream.read(1 << 20)
+            if not chunk:
+                break
+            data += chunk
+        return bytes(data)
+    try:
+        buf = _READ_BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        # Pool exhausted under burst load; a transient buffer keeps us going
+        buf = memoryview(bytearray(1 << 20))
+    try:
+        data = bytearray()
+        while True:
+            n = stream.readinto(buf)
+            if not n:
+                break
+            data += buf[:n]
+        return bytes(data)
+    finally:
+        try:
+            _READ_BUFFER_POOL.put_nowait(buf)
+        except queue.Full:
+            pass
+
+def fast_save(data, path):
+    """Write upload bytes to path in a single unbuffered syscall."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    with os.fdopen(fd, 'wb', buffering=0) as out:
+        out.write(data)
+
+def _cache_upload(filename, data):
+    """Keep upload bytes in memory for the follow-up analyze request."""
+    UPLOAD_CACHE[filename] = data
+    while len(UPLOAD_CACHE) > UPLOAD_CACHE_MAX:
+        UPLOAD_CACHE.popitem(last=False)
+
+def _analysis_cache_path(digest):
+    """Return the on-disk cache file for a given font content digest."""
+    return os.path.join(CACHE_FOLDER, digest + '.json')
+
+def _load_cached_analysis(digest):
+    """Load a previously stored analysis for these font bytes, or None."""
+    try:
+        with open(_analysis_cache_path(digest)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _store_cached_analysis(digest, entry):
+    """Persist analysis results so identical uploads skip the pipeline."""
+    try:
+        with open(_analysis_cache_path(digest), 'w') as f:
+            json.dump(entry, f)
+    except (OSError, TypeError) as e:
+        logger.warning("Could not write analysis cache: %s", e)
+
+# Compiled once from ALLOWED_EXTENSIONS; equivalent to splitting on '.' and
+# lowercasing but without the per-call string allocations on the upload hot path
+_EXT_RE = re.compile(
+    r'\.(?:' + '|'.join(sorted(ALLOWED_EXTENSIONS)) + r')\Z', re.IGNORECASE)
+
 def allowed_file(filename):
     """Check if the file has an allowed extension."""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return bool(_EXT_RE.search(filename))
 
 @app.route('/')
 def index():
     """Render the home page."""
-    logger.info("Rendering index page")
+    logger.debug("Rendering index page")
     return render_template('index.html', 
                           variable_font_support=VARIABLE_FONT_SUPPORT,
                           non_latin_support=NON_LATIN_SUPPORT)
@@ -96,14 +287,26 @@ def upload_file():
             return redirect(url_for('index'))
         
         if file and allowed_file(file.filename):
-            # Generate a unique filename to prevent collisions
-            unique_id = str(uuid.uuid4())
+            # Read the upload once and hand the bytes straight to the analyze
+            # step; the disk copy is kept for crash safety and as the
+            # cross-worker fallback
             original_filename = secure_filename(file.filename)
-            filename = f"{unique_id}_{original_filename}"
+            data = _read_stream(file.stream)
+
+            # Content-addressed filename: identical bytes always map to the
+            # same stored file and results directory, so duplicate uploads
+            # (popular typefaces, retries) collapse onto one copy on disk
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            extension = original_filename.rsplit('.', 1)[-1].lower()
+            filename = f"{digest}.{extension}"
             filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            
-            logger.info(f"Saving file to {filepath}")
-            file.save(filepath)
+
+            if os.path.exists(filepath):
+                logger.info("Duplicate upload, reusing stored copy %s", filename)
+            else:
+                logger.debug("Saving file to %s", filepath)
+                fast_save(data, filepath)
+            _cache_upload(filename, data)
             
             # Get analysis options from form
             options = {}
@@ -114,9 +317,9 @@ def upload_file():
                     'variable_only': 'variable_only' in request.form and VARIABLE_FONT_SUPPORT,
                     'analyze_non_latin': 'analyze_non_latin' in request.form and NON_LATIN_SUPPORT
                 }
-                logger.info(f"Analysis options: {options}")
+                logger.debug("Analysis options: %s", options)
             except Exception as e:
-                logger.warning(f"Error parsing form options: {str(e)}")
+                logger.warning("Error parsing form options: %s", e)
                 # Use default options if form parsing fails
                 options = {
                     'generate_visualization': True,
@@ -124,21 +327,21 @@ def upload_file():
                     'variable_only': False,
                     'analyze_non_latin': False
                 }
-                logger.info(f"Using default options: {options}")
+                logger.debug("Using default options: %s", options)
             
             # Process the font file
             return redirect(url_for('analyze_font', filename=filename, **options))
         
-        logger.warning(f"Invalid file type: {file.filename}")
+        logger.warning("Invalid file type: %s", file.filename)
         flash('Invalid file type. Allowed types: TTF, OTF, WOFF, WOFF2')
         return redirect(url_for('index'))
     
     except werkzeug.exceptions.ClientDisconnected as e:
-        logger.error(f"Client disconnected during upload: {str(e)}")
+        logger.error("Client disconnected during upload: %s", e)
         flash('Upload was interrupted. Please try again.')
         return redirect(url_for('index'))
     except Exception as e:
-        logger.error(f"Error in upload_file: {str(e)}")
+        logger.error("Error in upload_file: %s", e)
         logger.error(traceback.format_exc())
         flash(f'An error occurred: {str(e)}')
         return redirect(url_for('index'))
@@ -146,80 +349,132 @@ def upload_file():
 @app.route('/analyze/<filename>')
 def analyze_font(filename):
     """Analyze the uploaded font file and display results."""
-    logger.info(f"Analyze route called for file: {filename}")
+    logger.info("Analyze route called for file: %s", filename)
     
     try:
         filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        
-        logger.info(f"Checking file at path: {filepath}")
-        if not os.path.exists(filepath):
-            logger.warning(f"File not found: {filepath}")
+
+        # Prefer the in-memory bytes handed off by the upload route; fall
+        # back to re-reading the saved file
+        font_data = UPLOAD_CACHE.pop(filename, None)
+
+        logger.debug("Checking file at path: %s", filepath)
+        if font_data is None and not os.path.exists(filepath):
+            logger.warning("File not found: %s", filepath)
             flash('File not found')
             return redirect(url_for('index'))
         
-        # Check if variable font only option is enabled
+        # Content-addressed result cache: identical font bytes short-circuit
+        # to the stored properties and already-rendered artifacts
+        if font_data is None:
+            with open(filepath, 'rb') as f:
+                font_data = f.read()
+        digest = hashlib.blake2b(font_data, digest_size=16).hexdigest()
+        cached = _load_cached_analysis(digest)
+
+        # Check if variable font only option is enabled; this rejection has
+        # to run before the cached fast path, or a static font already in
+        # the content-addressed cache would be served full results anyway
         variable_only = request.args.get('variable_only', 'false').lower() == 'true'
-        
-        # If variable only is enabled, check if the font is variable
         if variable_only and VARIABLE_FONT_SUPPORT:
-            logger.info("Checking if font is variable")
+            logger.debug("Checking if font is variable")
             if not is_variable_font(filepath):
                 logger.warning("Font is not a variable font")
                 flash('The uploaded font is not a variable font')
                 return redirect(url_for('index'))
-        
-        # Extract font properties
-        logger.info("Extracting font properties")
-        font_properties = extract_font_properties(filepath)
+
+        # Fast path: when everything this request asks for is already cached,
+        # render immediately without touching fontTools or the viz pipeline
+        if cached and cached.get('font_properties'):
+            viz_wanted = request.args.get('generate_visualization', 'false').lower() == 'true'
+            report_wanted = request.args.get('generate_report', 'false').lower() == 'true'
+            if (not viz_wanted or cached.get('viz_paths')) and (not report_wanted or cached.get('report_path')):
+                logger.info("Serving fully cached results for digest %s", digest)
+                return render_template('results.html',
+                                      font_properties=cached['font_properties'],
+                                      viz_paths=cached.get('viz_paths', {}) if viz_wanted else {},
+                                      report_path=cached.get('report_path') if report_wanted else None,
+                                      filename=filename)
+
+        if cached:
+            logger.info("Analysis cache hit for digest %s", digest)
+            font_properties = cached.get('font_properties')
+        else:
+            # Extract font properties
+            logger.debug("Extracting font properties")
+            font_properties = extract_font_properties(font_data, filename=filename)
         
         if not font_properties:
             logger.error("Failed to analyze font")
             flash('Failed to analyze font')
             return redirect(url_for('index'))
         
+        # Both generators write into the same per-upload directory; set it up
+        # once instead of stat+mkdir per branch
+        generate_viz = request.args.get('generate_visualization', 'false').lower() == 'true'
+        generate_report = request.args.get('generate_report', 'false').lower() == 'true'
+        output_dir = os.path.join(app.config['RESULTS_FOLDER'], filename.split('.')[0])
+        if generate_viz or generate_report:
+            os.makedirs(output_dir, exist_ok=True)
+
         # Generate visualizations if requested
         viz_paths = {}
-        if request.args.get('generate_visualization', 'false').lower() == 'true':
-            logger.info("Generating visualizations")
-            output_dir = os.path.join(app.config['RESULTS_FOLDER'], filename.split('.')[0])
-            os.makedirs(output_dir, exist_ok=True)
+        if generate_viz and cached and cached.get('viz_paths'):
+            viz_paths = cached['viz_paths']
+            logger.debug("Reusing cached visualizations: %s", list(viz_paths.keys()))
+        elif generate_viz:
+            logger.debug("Generating visualizations")
             full_viz_paths = visualize_font_properties(font_properties, output_dir)
             
             # Convert the full paths to paths relative to RESULTS_FOLDER for the template
             if full_viz_paths:
                 viz_paths = {k: os.path.relpath(v, app.config['RESULTS_FOLDER']) for k, v in full_viz_paths.items()}
-                logger.info(f"Visualizations generated: {list(viz_paths.keys())}")
-                # Log each visualization path for debugging
-                for viz_type, viz_path in viz_paths.items():
-                    logger.info(f"Visualization {viz_type}: {viz_path}")
-                    logger.info(f"Full path: {os.path.join(app.config['RESULTS_FOLDER'], viz_path)}")
-                    logger.info(f"File exists: {os.path.exists(os.path.join(app.config['RESULTS_FOLDER'], viz_path))}")
+                logger.info("Visualizations generated: %s", list(viz_paths.keys()))
+                # Per-file existence checks are a stat() each, so only pay
+                # for them when debugging; one scandir covers all of them
+                if logger.isEnabledFor(logging.DEBUG):
+                    existing = {e.name for e in os.scandir(output_dir)}
+                    for viz_type, viz_path in viz_paths.items():
+                        logger.debug("Visualization %s: %s (exists: %s)", viz_type, viz_path,
+                                     os.path.basename(viz_path) in existing)
         
-        # Generate report if requested
+        # Generate report if requested; reports no longer require the
+        # visualization step, so a report-only run works
         report_path = None
-        if request.args.get('generate_report', 'false').lower() == 'true' and viz_paths:
-            logger.info("Generating report")
-            # Create the output directory for the report
-            report_output_dir = os.path.join(app.config['RESULTS_FOLDER'], filename.split('.')[0])
-            full_report_path = create_font_report(font_properties, report_output_dir)
+        if generate_report and cached and cached.get('report_path'):
+            report_path = cached['report_path']
+            logger.debug("Reusing cached report: %s", report_path)
+        elif generate_report:
+            logger.debug("Generating report")
+            full_report_path = create_font_report(font_properties, output_dir)
             
             # Convert the full path to a path relative to RESULTS_FOLDER for the template
             if full_report_path:
                 report_path = os.path.relpath(full_report_path, app.config['RESULTS_FOLDER'])
-                logger.info(f"Report generated at: {report_path}")
-                logger.info(f"Full report path: {os.path.join(app.config['RESULTS_FOLDER'], report_path)}")
-                logger.info(f"Report file exists: {os.path.exists(os.path.join(app.config['RESULTS_FOLDER'], report_path))}")
+                logger.info("Report generated at: %s", report_path)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Report file exists: %s", os.path.exists(full_report_path))
         
+        # Record the results so the next upload of the same bytes skips the
+        # whole pipeline; merge so a viz-only run doesn't drop a cached report
+        entry = {
+            'font_properties': font_properties,
+            'viz_paths': viz_paths or (cached.get('viz_paths', {}) if cached else {}),
+            'report_path': report_path or (cached.get('report_path') if cached else None),
+        }
+        if entry != cached:
+            _store_cached_analysis(digest, entry)
+
         # Render the results page
-        logger.info("Rendering results page")
-        return render_template('results.html', 
+        logger.debug("Rendering results page")
+        return render_template('results.html',
                               font_properties=font_properties,
                               viz_paths=viz_paths,
                               report_path=report_path,
                               filename=filename)
     
     except Exception as e:
-        logger.error(f"Error in analyze_font: {str(e)}")
+        logger.error("Error in analyze_font: %s", e)
         logger.error(traceback.format_exc())
         flash(f'An error occurred: {str(e)}')
         return redirect(url_for('index'))
@@ -227,20 +482,37 @@ def analyze_font(filename):
 @app.route('/results/<path:filename>')
 def download_file(filename):
     """Serve generated files."""
-    logger.info(f"Download route called for file: {filename}")
+    logger.debug("Download route called for file: %s", filename)
     try:
         # Log the full path being requested
         full_path = os.path.join(app.config['RESULTS_FOLDER'], filename)
-        logger.info(f"Attempting to serve file from: {full_path}")
+        logger.debug("Attempting to serve file from: %s", full_path)
         
         # Check if the file exists
         if not os.path.exists(full_path):
-            logger.error(f"File not found: {full_path}")
+            logger.error("File not found: %s", full_path)
             return f"File not found: {filename}", 404
-            
+
+        if USE_ACCEL_REDIRECT:
+            # send_from_directory safe-joins the path for us, but the accel
+            # header is built by hand — reject anything that resolves outside
+            # the results folder before handing the name to nginx
+            results_root = os.path.realpath(app.config['RESULTS_FOLDER'])
+            if not os.path.realpath(full_path).startswith(results_root + os.sep):
+                logger.error("Rejected accel path outside results folder: %s", filename)
+                return f"File not found: {filename}", 404
+            # Hand the transfer to nginx; the empty response body is replaced
+            # by the file at the internal location
+            response = make_response('')
+            response.headers['X-Accel-Redirect'] = '/internal-results/' + filename
+            content_type = mimetypes.guess_type(filename)[0]
+            if content_type:
+                response.headers['Content-Type'] = content_type
+            return response
+
         return send_from_directory(app.config['RESULTS_FOLDER'], filename)
     except Exception as e:
-        logger.error(f"Error in download_file: {str(e)}")
+        logger.error("Error in download_file: %s", e)
         logger.error(traceback.format_exc())
         flash(f'An error occurred: {str(e)}')
         return redirect(url_for('index'))
@@ -261,18 +533,11 @@ def api_analyze():
             return jsonify({'error': 'No selected file'}), 400
         
         if file and allowed_file(file.filename):
-            # Generate a unique filename to prevent collisions
-            unique_id = str(uuid.uuid4())
             original_filename = secure_filename(file.filename)
-            filename = f"{unique_id}_{original_filename}"
-            filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            
-            logger.info(f"Saving API file to {filepath}")
-            file.save(filepath)
-            
-            # Extract font properties
-            logger.info("Extracting font properties for API request")
-            font_properties = extract_font_properties(filepath)
+            # Analyze straight from the upload bytes; the API route never
+            # serves the file back, so there is nothing to persist
+            logger.debug("Extracting font properties for API request")
+            font_properties = extract_font_properties(_read_stream(file.stream), filename=original_filename)
             
             if not font_properties:
                 logger.error("Failed to analyze font for API request")
@@ -283,22 +548,124 @@ def api_analyze():
                 'font_properties': font_properties
             })
         
-        logger.warning(f"Invalid file type in API request: {file.filename}")
+        logger.warning("Invalid file type in API request: %s", file.filename)
         return jsonify({'error': 'Invalid file type'}), 400
     
     except Exception as e:
-        logger.error(f"Error in api_analyze: {str(e)}")
+        logger.error("Error in api_analyze: %s", e)
         logger.error(traceback.format_exc())
         return jsonify({'error': f'An error occurred: {str(e)}'}), 500
 
+@app.route('/api/analyze_async', methods=['POST'])
+def api_analyze_async():
+    """Queue a font analysis job and return its id immediately."""
+    logger.info("Async API analyze route called")
+
+    try:
+        if 'font_file' not in request.files:
+            logger.warning("No file part in async API request")
+            return jsonify({'error': 'No file part'}), 400
+
+        file = request.files['font_file']
+        if file.filename == '':
+            logger.warning("No selected file in async API request")
+            return jsonify({'error': 'No selected file'}), 400
+
+        if not (file and allowed_file(file.filename)):
+            logger.warning("Invalid file type in async API request: %s", file.filename)
+            return jsonify({'error': 'Invalid file type'}), 400
+
+        # Shed load fast instead of queueing unboundedly under overload
+        if not _JOB_SLOTS.acquire(blocking=False):
+            logger.warning("Job queue full, rejecting async request")
+            return jsonify({'error': 'Server busy, try again later'}), 503
+
+        try:
+            job_id = secrets.token_urlsafe(12)
+            filename = f"{job_id}_{secure_filename(file.filename)}"
+            data = _read_stream(file.stream)
+            # Record pending state before submitting so the done-callback
+            # can never lose the race against it
+            _write_job_state(job_id, {'state': 'pending'})
+            future = _get_job_executor().submit(
+                _analyze_job, data, filename,
+                generate_visualization='generate_viz' in request.form,
+                generate_report='generate_report' in request.form)
+            future.add_done_callback(lambda f, jid=job_id: _record_job_result(jid, f))
+        except Exception:
+            _JOB_SLOTS.release()
+            raise
+
+        _prune_job_states()
+
+        return jsonify({'job_id': job_id,
+                        'status_url': url_for('job_status', job_id=job_id)}), 202
+
+    except Exception as e:
+        logger.error("Error in api_analyze_async: %s", e)
+        logger.error(traceback.format_exc())
+        return jsonify({'error': f'An error occurred: {str(e)}'}), 500
+
+@app.route('/status/<job_id>')
+def job_status(job_id):
+    """Report the state of a queued analysis job."""
+    if not _JOB_ID_RE.match(job_id):
+        return jsonify({'error': 'Unknown job id'}), 404
+
+    try:
+        with open(_job_state_path(job_id)) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return jsonify({'error': 'Unknown job id'}), 404
+
+    if state.get('state') == 'pending':
+        return jsonify({'state': 'pending'})
+
+    # Terminal states stay on disk so a poll lost to a proxy timeout or a
+    # client retry can be answered again; _prune_job_states ages them out
+    if state.get('state') == 'failed':
+        return jsonify(state), 500
+    return jsonify(state)
+
+@app.route('/cache/clear', methods=['POST'])
+def clear_cache():
+    """Drop the in-process font caches (admin eviction hook)."""
+    logger.info("Clearing in-process font caches")
+    clear_ttfont_cache()
+    UPLOAD_CACHE.clear()
+    return jsonify({'success': True})
+
 @app.route('/compare')
 def compare_fonts():
     """Render the font comparison page."""
-    logger.info("Rendering compare fonts page")
+    logger.debug("Rendering compare fonts page")
     return render_template('compare.html',
                           variable_font_support=VARIABLE_FONT_SUPPORT,
                           non_latin_support=NON_LATIN_SUPPORT)
 
+def _prewarm_matplotlib():
+    """Pay matplotlib's one-time setup cost (font cache scan, rcParams) at
+    worker startup instead of on the first user's analyze request."""
+    try:
+        import io
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=(1, 1))
+        plt.plot([0, 1], [0, 1])
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png')
+        plt.close(fig)
+        logger.debug("Matplotlib pre-warm complete")
+    except Exception as e:
+        # A failed warm-up must never keep the worker from serving
+        logger.warning("Matplotlib pre-warm failed: %s", e)
+
+# fontTools is already fully imported via font_validator above; matplotlib
+# still defers its expensive first-render work until a figure is drawn
+_prewarm_matplotlib()
+
 if __name__ == '__main__':
     logger.info("Starting Flask application")
-    app.run(debug=True, port=5001) 
\ No newline at end of file
+    # threaded=True lets the dev server overlap concurrent uploads and
+    # analyses instead of serializing them on a single worker thread.
+    # Production deployments run under gunicorn (see render.yaml).
+    app.run(debug=True, port=5001, threaded=True)
\ No newline at end of file
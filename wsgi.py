@@ -0,0 +1,9 @@
+"""
+WSGI entry point for production servers.
+
+Run with:
+    gunicorn -c gunicorn.config.py wsgi:app
+
+The dev server (python web_interface.py) is only for local development.
+"""
+from web_interface import app  # noqa: F401